@@ -42,12 +42,17 @@ Reprogramming predictions:
 >>> cb_seq_temp = cabean.AttractorSequential_Temporary(cb)
 >>> rs = cb_seq_temp.attractor_to_attractor(source, target)
 >>> rs.as_graph()
+# several methods for the same source and target, run in parallel:
+>>> rs = cabean.MultiMethod(cb).attractor_to_attractor(source, target, ["OI", "OT", "OP"])
+>>> rs["OP"].as_table()
 
 See ``help(rs)`` for other display methods
 
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import itertools
+import os
 from warnings import warn
 import sys
 
@@ -72,7 +77,9 @@ def load(bn, *spec, **kwspec):
 
 class CabeanInstance(object):
     """
-    CABEAN Boolean network model, storing the list of its attractors
+    CABEAN Boolean network model, storing the list of its attractors.
+
+    Instances can be shared between threads.
     """
     def __init__(self, bn, *spec, **kwspec):
         """
@@ -93,6 +100,57 @@ class CabeanInstance(object):
         self.iface = CabeanIface(bn, init=init)
         self.attractors = self.iface.attractors()
 
+    @property
+    def reachability(self):
+        """
+        Reachability relation between the attractors of the unperturbed
+        network, as a dictionnary mapping each attractor index to the set of
+        attractor indexes reachable from it.
+
+        As attractors are terminal strongly connected components of the
+        asynchronous state transition graph, no other attractor can be
+        reached from an attractor without perturbation: the relation is
+        computed from the attractor list, without any call to CABEAN.
+        """
+        return dict([(a, {a}) for a in self.attractors])
+
+    def attractor_distance(self, a, b):
+        """
+        Number of nodes having a different fixed value in attractors `a` and
+        `b`, used as an estimation of the difficulty of the reprogramming from
+        `a` to `b`.
+        """
+        fa = fixed_values(self.attractors[a])
+        fb = fixed_values(self.attractors[b])
+        return len([n for n, v in fa.items() if n in fb and fb[n] != v])
+
+    def trivial_pairs(self, aorigs, adests):
+        """
+        Returns the list of (source, target) attractor pairs where the target
+        is reachable from the source without perturbation.
+        """
+        reach = self.reachability
+        return [(a, b) for a in aorigs for b in adests
+                    if b in reach.get(a, ())]
+
+    def control_pairs(self, aorigs, adests, ordered=False):
+        """
+        Returns the list of (source, target) attractor pairs which require a
+        CABEAN query, i.e., excluding :py:meth:`.trivial_pairs`.
+
+        :keyword bool ordered: if `True`, pairs are sorted by decreasing
+            :py:meth:`.attractor_distance`, so that the presumably longest
+            queries are started first when run in parallel. Otherwise, pairs
+            are in the source-major order of `aorigs` and `adests`.
+        """
+        reach = self.reachability
+        pairs = [(a, b) for a in aorigs for b in adests
+                    if b not in reach.get(a, ())]
+        if ordered:
+            pairs.sort(key=lambda ab: self.attractor_distance(*ab),
+                        reverse=True)
+        return pairs
+
 def _cabean_instance(model, *spec, **kwspec):
     if not isinstance(model, CabeanInstance):
         return CabeanInstance(model, *spec, **kwspec)
@@ -100,6 +158,21 @@ def _cabean_instance(model, *spec, **kwspec):
         raise TypeError("wrong arguments")
     return model
 
+def fixed_values(attractor):
+    """
+    Returns the dictionnary of nodes having the same Boolean value in all the
+    states of `attractor` (``Hypercube`` or ``HypercubeCollection``).
+    """
+    hcs = attractor if isinstance(attractor, list) else [attractor]
+    fixed = None
+    for h in hcs:
+        hf = dict([(n, v) for (n, v) in h.items() if v in [0,1]])
+        if fixed is None:
+            fixed = hf
+        else:
+            fixed = dict([(n, v) for (n, v) in fixed.items() if hf.get(n) == v])
+    return fixed or {}
+
 def alias(a):
     return "a{}".format(a)
 
@@ -116,16 +189,25 @@ def assignments_from_flips(orig, nodes):
 
 class _CabeanReprogramming(object):
 
-    def register_aliases(self, strategies, attractor_ids):
+    def register_aliases(self, strategies, attractors, attractor_ids):
         for a in attractor_ids:
-            strategies.register_alias(alias(a), self.attractors[a])
+            strategies.register_alias(alias(a), attractors[a])
 
-    def strategy_step(self, a, m, next_step=None):
-        orig = self.attractors[a]
+    def strategy_step(self, attractors, a, m, next_step=None):
+        orig = attractors[a]
         p = _PTYPE[self.method[-1]](m)
         t = FromSteadyState if orig.is_single_state else FromOneInLimitCycle
         return t(alias(a), p, *((next_step,) if next_step is not None else ()))
 
+    def add_trivial_strategies(self, strategies, attractors, pairs):
+        """
+        Adds the empty perturbation for pairs of attractors which do not
+        require any control.
+        """
+        for (a, b) in pairs:
+            strategies.add(self.strategy_step(attractors, a, {}),
+                    result=alias(b))
+
 
 def matching_attractors(attractors, pstate):
     return [i for i,a in attractors.items() if a.match_partial_state(pstate)]
@@ -134,20 +216,41 @@ class _CabeanAttractorReprogramming(_CabeanReprogramming):
     def __init__(self, bn, inputs=None):
         self.ci = _cabean_instance(bn, inputs) if inputs else _cabean_instance(bn)
         self.iface = self.ci.iface
-        self.attractors = self.ci.attractors
 
-    def check_attractors_integrity(self, result, *indexes):
+    @property
+    def attractors(self):
+        return self.ci.attractors
+
+    def check_attractors_integrity(self, attractors, result, *indexes):
+        """
+        Checks that the attractor indexes of `result` are the same as in
+        `attractors`, the snapshot used by the query. Otherwise, the attractors
+        of `result` are published to the :py:class:`.CabeanInstance`, and the
+        query should be restarted.
+        """
         if debug_enabled():
             if not indexes:
-                indexes = self.attractors.keys()
+                indexes = attractors.keys()
             for i in indexes:
-                if self.attractors[i] != result.attractors[i]:
+                if attractors[i] != result.attractors[i]:
                     warn("CABEAN: unstable indexes of attractors... trying again...")
-                    self.attractors = result.attractors
+                    self.ci.attractors = result.attractors
                     return False
             return True
         return True
 
+    def control_args(self, exclude=None, maxpert=None):
+        args = []
+        if exclude:
+            args += ["-rmPert",
+                    self.iface.make_exclude_perturbations(exclude)]
+        return args
+
+    def execute_control(self, a, b, *args):
+        return self.iface.execute("-compositional", "2",
+                "-control", self.method, "-sin", str(a+1), "-tin", str(b+1),
+                *args)
+
 class _OneStep(_CabeanAttractorReprogramming):
     """
     One-step reprogramming strategies consist of a set of perturbations which,
@@ -166,31 +269,37 @@ class _OneStep(_CabeanAttractorReprogramming):
         * :py:class:`.OneStep_Temporary`
         * :py:class:`.OneStep_Permanent`
 
+        When an attractor matches with both `orig` and `dest`, the empty
+        perturbation is returned for it, without calling CABEAN.
+
         :keyword list(str) exclude: list of nodes to exclude from perturbations.
 
         :rtype: `algorecell_types.ReprogrammingStrategies <https://algorecell-types.readthedocs.io/#algorecell_types.ReprogrammingStrategies>`_
         """
-        args = []
-        if exclude:
-            args += ["-rmPert",
-                    self.iface.make_exclude_perturbations(exclude)]
-        aorigs = matching_attractors(self.attractors, orig)
-        adests = matching_attractors(self.attractors, dest)
+        args = self.control_args(exclude)
+        attractors = self.attractors
+        aorigs = matching_attractors(attractors, orig)
+        adests = matching_attractors(attractors, dest)
         strategies = ReprogrammingStrategies()
-        self.register_aliases(strategies, set(aorigs).union(adests))
-        for a in aorigs:
-            for b in adests:
-                result = self.iface.execute("-compositional", "2",
-                        "-control", self.method, "-sin", str(a+1), "-tin", str(b+1),
-                        *args)
-                if not self.check_attractors_integrity(result, a, b):
-                    return self.attractor_to_attractor(orig, dest)
-                controls = getattr(result, f"parse_{self.method}")()
-                for sol in controls.get((a,b),[]):
-                    s = self.strategy_step(a, sol)
-                    strategies.add(s, result=alias(b))
+        used_attractors = set(aorigs).union(adests)
+        self.add_trivial_strategies(strategies, attractors,
+                self.ci.trivial_pairs(aorigs, adests))
+        for (a, b) in self.ci.control_pairs(aorigs, adests):
+            result = self.execute_control(a, b, *args)
+            if not self.check_attractors_integrity(attractors, result, a, b):
+                return self.attractor_to_attractor(orig, dest, exclude=exclude)
+            self.add_strategies(strategies, used_attractors, attractors,
+                    result, a, b)
+        self.register_aliases(strategies, attractors, used_attractors)
         return strategies
 
+    def add_strategies(self, strategies, used_attractors, attractors,
+            result, a, b):
+        controls = getattr(result, f"parse_{self.method}")()
+        for sol in controls.get((a,b),[]):
+            s = self.strategy_step(attractors, a, sol)
+            strategies.add(s, result=alias(b))
+
 class OneStep_Instantaneous(_OneStep):
     """
     One-step reprogramming with instantaneous perturbations
@@ -230,38 +339,48 @@ class _AttractorSequential(_CabeanAttractorReprogramming):
         * :py:class:`.AttractorSequential_Temporary`
         * :py:class:`.AttractorSequential_Permanent`
 
+        When an attractor matches with both `orig` and `dest`, the empty
+        perturbation is returned for it, without calling CABEAN.
+
         :keyword list(str) exclude: list of nodes to exclude from perturbations.
         :keyword int maxpert: maximum number of steps
 
         :rtype: `algorecell_types.ReprogrammingStrategies <https://algorecell-types.readthedocs.io/#algorecell_types.ReprogrammingStrategies>`_
         """
-        args = []
-        if exclude:
-            args += ["-rmPert",
-                    self.iface.make_exclude_perturbations(exclude)]
-        if maxpert:
-            args += ["-maxpert", str(maxpert)]
-        aorigs = matching_attractors(self.attractors, orig)
-        adests = matching_attractors(self.attractors, dest)
+        args = self.control_args(exclude, maxpert)
+        attractors = self.attractors
+        aorigs = matching_attractors(attractors, orig)
+        adests = matching_attractors(attractors, dest)
         strategies = ReprogrammingStrategies()
         used_attractors = set(aorigs).union(adests)
-        for a in aorigs:
-            for b in adests:
-                result = self.iface.execute("-compositional", "2",
-                        "-control", self.method, "-sin", str(a+1), "-tin", str(b+1),
-                        *args)
-                if not self.check_attractors_integrity(result, a, b):
-                    return self.attractor_to_attractor(orig, dest)
-                controls = getattr(result, f"parse_{self.method}")()
-                for sol in controls.get((a,b),[]):
-                    s = None
-                    for (c, m) in reversed(sol):
-                        s = self.strategy_step(c, m, s)
-                        used_attractors.add(c)
-                    strategies.add(s, result=alias(b))
-        self.register_aliases(strategies, used_attractors)
+        self.add_trivial_strategies(strategies, attractors,
+                self.ci.trivial_pairs(aorigs, adests))
+        for (a, b) in self.ci.control_pairs(aorigs, adests):
+            result = self.execute_control(a, b, *args)
+            if not self.check_attractors_integrity(attractors, result, a, b):
+                return self.attractor_to_attractor(orig, dest,
+                        exclude=exclude, maxpert=maxpert)
+            self.add_strategies(strategies, used_attractors, attractors,
+                    result, a, b)
+        self.register_aliases(strategies, attractors, used_attractors)
         return strategies
 
+    def control_args(self, exclude=None, maxpert=None):
+        args = super().control_args(exclude)
+        if maxpert:
+            args += ["-maxpert", str(maxpert)]
+        return args
+
+    def add_strategies(self, strategies, used_attractors, attractors,
+            result, a, b):
+        controls = getattr(result, f"parse_{self.method}")()
+        for sol in controls.get((a,b),[]):
+            s = None
+            for (c, m) in reversed(sol):
+                s = self.strategy_step(attractors, c, m, s)
+                used_attractors.add(c)
+            strategies.add(s, result=alias(b))
+
 class AttractorSequential_Instantaneous(_AttractorSequential):
     """
     Attractor-sequential reprogramming with instantaneous perturbations.
@@ -282,6 +401,104 @@ class AttractorSequential_Permanent(_AttractorSequential):
     """
     method = "ASP"
 
+_METHODS = dict([(cls.method, cls) for cls in [
+    OneStep_Instantaneous, OneStep_Temporary, OneStep_Permanent,
+    AttractorSequential_Instantaneous, AttractorSequential_Temporary,
+    AttractorSequential_Permanent]])
+
+class MultiMethod(object):
+    """
+    Computation of reprogramming strategies with several one-step and
+    attractor-sequential methods for the same source and target attractors,
+    sharing the model, its ISPL encoding, and the pruning of attractor pairs.
+    CABEAN computing one control method per execution, the executions for the
+    different methods and attractor pairs are run in parallel.
+
+    Example:
+
+    >>> cb_multi = cabean.MultiMethod(cb)
+    >>> rs = cb_multi.attractor_to_attractor(source, target, ["OI", "OT", "OP"])
+    >>> rs["OT"].as_table()
+    """
+    def __init__(self, bn, inputs=None):
+        self.ci = _cabean_instance(bn, inputs) if inputs else _cabean_instance(bn)
+
+    def attractor_to_attractor(self, orig, dest, methods=("OI", "OT", "OP"),
+            exclude=None, maxpert=None, max_workers=None):
+        """
+        Compute reprogramming strategies for enforcing the reachability
+        of an attractor of the model matching with `dest` from an attractor matching with
+        `orig`, for each of the given `methods`.
+
+        When an attractor matches with both `orig` and `dest`, the empty
+        perturbation is returned for it, without calling CABEAN.
+
+        :param list(str) methods: control methods among ``"OI"``, ``"OT"``,
+            ``"OP"`` (:py:class:`._OneStep`) and ``"ASI"``, ``"AST"``,
+            ``"ASP"`` (:py:class:`._AttractorSequential`).
+        :keyword list(str) exclude: list of nodes to exclude from perturbations.
+        :keyword int maxpert: maximum number of steps (attractor-sequential
+            methods only)
+        :keyword int max_workers: maximum number of parallel CABEAN executions
+            (default: number of CPUs, as given by ``os.cpu_count()``)
+
+        :rtype: dict mapping each method to a `algorecell_types.ReprogrammingStrategies <https://algorecell-types.readthedocs.io/#algorecell_types.ReprogrammingStrategies>`_
+        """
+        methods = list(dict.fromkeys(methods))
+        for m in methods:
+            if m not in _METHODS:
+                raise ValueError("Unsupported method '{}'".format(m))
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        progs = dict([(m, _METHODS[m](self.ci)) for m in methods])
+        args = dict([(m, p.control_args(exclude, maxpert))
+                        for (m, p) in progs.items()])
+        attractors = self.ci.attractors
+        aorigs = matching_attractors(attractors, orig)
+        adests = matching_attractors(attractors, dest)
+        strategies = dict([(m, ReprogrammingStrategies()) for m in methods])
+        used_attractors = dict([(m, set(aorigs).union(adests)) for m in methods])
+        trivial_pairs = self.ci.trivial_pairs(aorigs, adests)
+        for m, p in progs.items():
+            p.add_trivial_strategies(strategies[m], attractors, trivial_pairs)
+        # strategies are added in source-major order, whereas executions are
+        # submitted hardest first
+        pairs = self.ci.control_pairs(aorigs, adests)
+        pending = dict([(m, list(reversed(pairs))) for m in methods])
+        buffered = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = dict([(executor.submit(progs[m].execute_control, a, b,
+                                *args[m]), (m, a, b))
+                            for (a, b) in self.ci.control_pairs(aorigs, adests,
+                                                ordered=True)
+                            for m in methods])
+            def cancel():
+                for f in futures:
+                    f.cancel()
+            for future in as_completed(futures):
+                m, a, b = futures.pop(future)
+                try:
+                    result = future.result()
+                except BaseException:
+                    cancel()
+                    raise
+                if not progs[m].check_attractors_integrity(attractors,
+                                    result, a, b):
+                    cancel()
+                    break
+                buffered[(m, a, b)] = result
+                while pending[m] and (m,) + pending[m][-1] in buffered:
+                    a, b = pending[m].pop()
+                    progs[m].add_strategies(strategies[m], used_attractors[m],
+                            attractors, buffered.pop((m, a, b)), a, b)
+            else:
+                for m, p in progs.items():
+                    p.register_aliases(strategies[m], attractors,
+                            used_attractors[m])
+                return strategies
+        return self.attractor_to_attractor(orig, dest, methods,
+                exclude=exclude, maxpert=maxpert, max_workers=max_workers)
+
 class Sequential_Instantaneous(_CabeanReprogramming):
     """
     Sequential reprogramming strategies consider reprogramming in several steps,
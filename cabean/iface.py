@@ -1,15 +1,24 @@
+from concurrent.futures import Future
+import io
 import itertools
 import os
 import subprocess
 import tempfile
+import threading
 
 from colomoto.types import *
 from colomoto_jupyter.sessionfiles import new_output_file
 
 from cabean.debug import debug_enabled
 
+# command running CABEAN, either a string or a list
+cabean_binary = "cabean"
 cabean_base_options = []
 
+# CABEAN executions in progress, indexed by command line and ISPL content
+_inflight = {}
+_inflight_lock = threading.Lock()
+
 class CabeanProcessError(subprocess.CalledProcessError):
     """
     Exception raised when a Pint command fails.
@@ -176,6 +185,20 @@ class CabeanIface(object):
         self.red = red
         self.pc = pc
         self.ordered_nodes = list(sorted(self.bn.keys()))
+        self.__lock = threading.Lock()
+        self.__exclude_files = {}
+
+    @property
+    def ispl(self):
+        """
+        ISPL encoding of the network, computed once.
+        """
+        with self.__lock:
+            if not hasattr(self, "_CabeanIface__cache_ispl"):
+                fp = io.StringIO()
+                self.write_ispl(fp)
+                self.__cache_ispl = fp.getvalue()
+            return self.__cache_ispl
 
     def attractors(self):
         result = self.execute("-compositional", "2")
@@ -183,8 +206,20 @@ class CabeanIface(object):
 
     def make_exclude_perturbations(self, exclude):
         """
-        TODO
+        Returns the path to a file specifying the perturbations to exclude for
+        CABEAN (``-rmPert`` option). The file is shared by identical
+        specifications.
         """
+        key = tuple(sorted(exclude))
+        with self.__lock:
+            excfile = self.__exclude_files.get(key)
+            # session files may have been removed in the meantime
+            if excfile is None or not os.path.exists(excfile):
+                excfile = self.__write_exclude_perturbations(exclude)
+                self.__exclude_files[key] = excfile
+        return excfile
+
+    def __write_exclude_perturbations(self, exclude):
         excfile = new_output_file(suffix="_rmPert.txt", prefix="cabean")
         x = {"R0": [], "R1": [], "R": []}
         for spec in exclude:
@@ -204,22 +239,63 @@ class CabeanIface(object):
             fp.write("R: {}\n".format(",".join(x["R"])))
         return excfile
 
-    def execute(self, *args, isplfile=None):
-        args = ["cabean", "-asynbn", "-steadystates", "-newtarjan", "-newpred"] \
+    def execute(self, *args, isplfile=None, binary=None):
+        """
+        Executes CABEAN with the given arguments on the ISPL encoding of the
+        network, and returns the corresponding :py:class:`.CabeanResult`.
+
+        Concurrent calls with identical arguments and network (e.g., from
+        different threads) are coalesced: a single CABEAN process is run, and
+        all callers receive the same result object.
+
+        :keyword str isplfile: path where the ISPL file should be written
+            (default: temporary file)
+        :keyword binary: command for running CABEAN, either a string or a list
+            (default: ``cabean_binary``), e.g.,
+            ``cabean.synthetic.standin_command()``.
+        """
+        binary = binary if binary is not None else cabean_binary
+        binary = [binary] if isinstance(binary, str) else list(binary)
+        args = binary + ["-asynbn", "-steadystates", "-newtarjan", "-newpred"] \
                 + cabean_base_options + list(args)
         if self.pc:
             args += ["-pc", str(self.pc)]
-        if debug_enabled():
-            isplfile = "/tmp/cabean.ispl"
+        ispl = self.ispl
+        key = (tuple(args), ispl, isplfile)
+        with _inflight_lock:
+            future = _inflight.get(key)
+            owner = future is None
+            if owner:
+                future = _inflight[key] = Future()
+        if not owner:
+            # an identical execution is in progress: share its result
+            return future.result()
+        try:
+            result = self.__run(args, ispl, isplfile)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                del _inflight[key]
+
+    def __run(self, args, ispl, isplfile=None):
+        if debug_enabled() and not isplfile:
+            # kept after execution for inspection
+            fd, isplfile = tempfile.mkstemp(suffix=".ispl", prefix="cabean")
+            os.close(fd)
+            print("ISPL file: {}".format(isplfile))
         if isplfile:
             tmpfile = isplfile
         else:
             fd, tmpfile = tempfile.mkstemp(suffix=".ispl", prefix="cabean")
             os.close(fd)
-        args.append(tmpfile)
+        args = args + [tmpfile]
         try:
             with open(tmpfile, "w") as fp:
-                self.write_ispl(fp)
+                fp.write(ispl)
             output = subprocess.check_output(args, stderr=subprocess.PIPE)
             return CabeanResult(self, output.decode())
         except subprocess.CalledProcessError as e:
@@ -0,0 +1,212 @@
+"""
+Generator of synthetic CABEAN outputs, and stand-in ``cabean`` executable
+replaying them.
+
+The generated outputs follow the format expected by
+:py:class:`cabean.iface.CabeanResult` for all its sections (attractors,
+one-step, attractor-sequential and sequential controls), at configurable
+sizes. They are meant for measuring the scaling of parsers and strategy
+construction without the actual CABEAN binary.
+
+Example:
+
+>>> from cabean import synthetic
+>>> output = synthetic.generate_output(nodes, nb_attractors=100,
+...             control="OI", nb_controls=1000)
+
+The stand-in executable is run with ``python -m cabean.synthetic``, and can be
+selected with the `binary` keyword of :py:meth:`cabean.iface.CabeanIface.execute`:
+
+>>> result = iface.execute("-control", "OI", binary=synthetic.standin_command())
+
+The high-level API (:py:class:`cabean.CabeanInstance` and reprogramming
+classes) does not take a `binary` argument: to run it with the stand-in
+executable, set the module-level default of :py:mod:`cabean.iface`:
+
+>>> cabean.iface.cabean_binary = synthetic.standin_command()
+
+Its sizes are read from the ``CABEAN_SYNTHETIC`` environment variable, e.g.,
+``CABEAN_SYNTHETIC="attractors=100,controls=1000,steps=3,seed=0"``.
+"""
+
+import os
+import random
+import sys
+
+_MODES = {
+    "I": "instantaneous",
+    "T": "temporary",
+    "P": "permanent",
+}
+
+def standin_command():
+    """
+    Returns the command line prefix running the stand-in executable.
+    """
+    return [sys.executable, "-m", "cabean.synthetic"]
+
+def format_state(values):
+    return ",".join([str(v) if v in [0,1] else "-" for v in values])
+
+def random_state(rng, nb_nodes):
+    return [rng.randint(0, 1) for _ in range(nb_nodes)]
+
+def random_controlset(rng, nodes, size):
+    return " ".join(["{}={}".format(n, rng.randint(0, 1)) \
+                for n in rng.sample(nodes, min(size, len(nodes)))])
+
+def iter_attractors(rng, nodes, nb_attractors, attractor_size=1):
+    for i in range(nb_attractors):
+        yield "=================== find attractor #{} : {} states ===================".format(i+1, attractor_size)
+        yield ": {} nodes".format(len(nodes))
+        for _ in range(attractor_size):
+            yield "{} 1".format(format_state(random_state(rng, len(nodes))))
+        yield ""
+
+def iter_onestep(rng, nodes, mode, pairs, nb_controls, controlset_size=2):
+    yield "==================== ONE-STEP {} CONTROL ====================".format(
+            mode.upper())
+    for (a, b) in pairs:
+        yield "source - {} target - {}".format(a+1, b+1)
+        for _ in range(nb_controls):
+            yield "control set: {}".format(
+                    random_controlset(rng, nodes, controlset_size))
+        yield "execution time: 0.00 seconds"
+
+def iter_attractor_sequential(rng, nodes, mode, pairs, nb_attractors,
+        nb_controls, nb_steps=2, controlset_size=2):
+    yield "========= ATTRACTOR-BASED SEQUENTIAL {} CONTROL =========".format(
+            mode.upper())
+    if nb_steps-1 > nb_attractors-2:
+        raise ValueError("{} steps require at least {} attractors".format(
+                nb_steps, nb_steps+1))
+    for (a, b) in pairs:
+        yield "source - {} target - {}".format(a+1, b+1)
+        others = [c for c in range(nb_attractors) if c not in [a, b]]
+        seq = [a] + rng.sample(others, nb_steps-1) + [b]
+        yield "Sequence of the attractors: {}".format(
+                " -> ".join([str(c+1) for c in seq]))
+        for k in range(len(seq)-1):
+            yield "step {}:".format(k+1)
+            for i in range(nb_controls):
+                yield "control set {}: {}".format(i+1,
+                        random_controlset(rng, nodes, controlset_size))
+        yield "execution time: 0.00 seconds"
+
+def iter_sequential(rng, nodes, nb_steps, nb_controls, controlset_size=2):
+    for k in range(nb_steps):
+        yield "STEP {}".format(k+1)
+        for i in range(nb_controls):
+            yield "path {}".format(i+1)
+            yield "from state: {}".format(
+                    format_state(random_state(rng, len(nodes))))
+            yield "driver nodes: {}".format(" ".join(
+                rng.sample(nodes, min(controlset_size, len(nodes)))))
+
+def iter_output(nodes, nb_attractors=10, attractor_size=1, control=None,
+        pairs=None, nb_controls=10, nb_steps=2, controlset_size=2, seed=0):
+    """
+    Yields the lines of a synthetic CABEAN output.
+
+    :param list(str) nodes: ordered list of nodes of the network
+    :keyword int nb_attractors: number of attractors
+    :keyword int attractor_size: number of states per attractor
+    :keyword str control: control method (``"OI"``, ``"OT"``, ``"OP"``,
+        ``"ASI"``, ``"AST"``, ``"ASP"``, ``"GSI"``), or ``None`` for attractors
+        only.
+    :keyword pairs: list of (source, target) attractor indexes (0-based);
+        defaults to all pairs of distinct attractors.
+    :keyword int nb_controls: number of control sets per pair (or step)
+    :keyword int nb_steps: number of steps of sequential strategies;
+        attractor-sequential strategies require ``nb_attractors > nb_steps``.
+    :keyword int controlset_size: number of nodes per control set
+    :keyword int seed: seed of the random generator
+    """
+    rng = random.Random(seed)
+    nodes = list(nodes)
+    if control != "GSI":
+        yield from iter_attractors(rng, nodes, nb_attractors, attractor_size)
+    if control is None:
+        return
+    if pairs is None:
+        pairs = [(a, b) for a in range(nb_attractors) \
+                    for b in range(nb_attractors) if a != b]
+    if control == "GSI":
+        yield from iter_sequential(rng, nodes, nb_steps, nb_controls,
+                controlset_size)
+    elif control.startswith("AS"):
+        yield from iter_attractor_sequential(rng, nodes, _MODES[control[-1]],
+                pairs, nb_attractors, nb_controls, nb_steps, controlset_size)
+    elif control.startswith("O"):
+        yield from iter_onestep(rng, nodes, _MODES[control[-1]], pairs,
+                nb_controls, controlset_size)
+    else:
+        raise ValueError("Unknown control method '{}'".format(control))
+    yield ""
+
+def generate_output(nodes, **kwargs):
+    """
+    Returns a synthetic CABEAN output as a string.
+    See :py:func:`.iter_output` for arguments.
+    """
+    return "\n".join(iter_output(nodes, **kwargs))
+
+def ispl_nodes(isplfile):
+    """
+    Returns the ordered list of Boolean variables declared in `isplfile`.
+    """
+    nodes = []
+    with open(isplfile) as fp:
+        invars = False
+        for line in fp:
+            line = line.strip()
+            if line == "Vars:":
+                invars = True
+            elif line == "end Vars":
+                break
+            elif invars and line.endswith(": boolean;"):
+                nodes.append(line.split(":")[0].strip())
+    return nodes
+
+def parse_sizes(spec):
+    sizes = {}
+    for kv in spec.split(","):
+        if kv.strip():
+            k, v = kv.split("=")
+            sizes[k.strip()] = int(v)
+    return sizes
+
+def main(argv=None, environ=None):
+    """
+    Stand-in ``cabean`` executable: writes on standard output a synthetic
+    output matching the given command line arguments.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    environ = os.environ if environ is None else environ
+    sizes = parse_sizes(environ.get("CABEAN_SYNTHETIC", ""))
+    opts = {}
+    for i, arg in enumerate(argv[:-1]):
+        if arg in ["-control", "-sin", "-tin"]:
+            opts[arg] = argv[i+1]
+    nodes = ispl_nodes(argv[-1])
+    nb_attractors = sizes.get("attractors", 10)
+    pairs = None
+    if "-sin" in opts and "-tin" in opts:
+        pairs = [(int(opts["-sin"])-1, int(opts["-tin"])-1)]
+    lines = iter_output(nodes,
+                nb_attractors=nb_attractors,
+                attractor_size=sizes.get("attractor_size", 1),
+                control=opts.get("-control"),
+                pairs=pairs,
+                nb_controls=sizes.get("controls", 10),
+                nb_steps=sizes.get("steps", 2),
+                controlset_size=sizes.get("controlset_size", 2),
+                seed=sizes.get("seed", 0))
+    out = sys.stdout
+    for line in lines:
+        out.write(line)
+        out.write("\n")
+    out.flush()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+import sys
+
+import pytest
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STANDIN = """
+import sys, time
+sys.path.insert(0, {repo!r})
+with open({log!r}, "a") as fp:
+    fp.write(" ".join(sys.argv[1:-1]) + "\\n")
+time.sleep({delay!r})
+if {fail!r} is not None and {fail!r} in " ".join(sys.argv[1:-1]) + " ":
+    sys.stderr.write("synthetic failure")
+    sys.exit(1)
+from cabean import synthetic
+synthetic.main(environ={{"CABEAN_SYNTHETIC": {sizes!r}}})
+"""
+
+class Standin(object):
+    """
+    Stand-in CABEAN executable logging its command lines.
+    It fails whenever its command line contains `fail`.
+    """
+    def __init__(self, path, sizes="", delay=0, fail=None):
+        self.log = str(path / "runs.log")
+        script = path / "standin_cabean.py"
+        script.write_text(STANDIN.format(repo=REPO, log=self.log,
+                delay=delay, fail=fail, sizes=sizes))
+        self.command = [sys.executable, str(script)]
+
+    def runs(self):
+        if not os.path.exists(self.log):
+            return []
+        with open(self.log) as fp:
+            return fp.read().splitlines()
+
+@pytest.fixture
+def standin(tmp_path):
+    """
+    Factory of :py:class:`Standin` executables
+    """
+    def make(**kwargs):
+        path = tmp_path / "standin{}".format(len(list(tmp_path.iterdir())))
+        path.mkdir()
+        return Standin(path, **kwargs)
+    return make
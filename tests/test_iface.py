@@ -0,0 +1,83 @@
+import os
+import sys
+import threading
+
+import pytest
+
+from colomoto.minibn import BooleanNetwork
+
+from cabean import iface
+from cabean.iface import CabeanIface, CabeanProcessError
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FAKE_CABEAN = """
+import sys, time
+sys.path.insert(0, {repo!r})
+with open({counter!r}, "a") as fp:
+    fp.write("x")
+time.sleep(1)
+if {fail!r}:
+    sys.stderr.write("synthetic failure")
+    sys.exit(1)
+from cabean import synthetic
+synthetic.main()
+"""
+
+def fake_cabean(tmp_path, fail=False):
+    counter = str(tmp_path / "count")
+    script = tmp_path / "fake_cabean.py"
+    script.write_text(FAKE_CABEAN.format(repo=REPO, counter=counter, fail=fail))
+    def nb_runs():
+        if not os.path.exists(counter):
+            return 0
+        with open(counter) as fp:
+            return len(fp.read())
+    return [sys.executable, str(script)], nb_runs
+
+def concurrent_execute(cf, binary, n=8):
+    barrier = threading.Barrier(n)
+    outcomes = [None] * n
+    def run(i):
+        barrier.wait()
+        try:
+            outcomes[i] = cf.execute("-control", "OI", "-sin", "1", "-tin", "2",
+                                    binary=binary)
+        except Exception as e:
+            outcomes[i] = e
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return outcomes
+
+@pytest.fixture
+def cf():
+    return CabeanIface(BooleanNetwork({"a": "b", "b": "a", "c": "!c"}))
+
+def test_coalesce_identical_executions(cf, tmp_path):
+    binary, nb_runs = fake_cabean(tmp_path)
+    outcomes = concurrent_execute(cf, binary)
+    assert nb_runs() == 1
+    assert all(o is outcomes[0] for o in outcomes)
+    assert (0, 1) in outcomes[0].parse_OI()
+    assert not iface._inflight
+
+def test_coalesce_failing_execution(cf, tmp_path):
+    binary, nb_runs = fake_cabean(tmp_path, fail=True)
+    outcomes = concurrent_execute(cf, binary)
+    assert nb_runs() == 1
+    assert all(isinstance(o, CabeanProcessError) for o in outcomes)
+    assert not iface._inflight
+    # a later call runs a new process
+    with pytest.raises(CabeanProcessError):
+        cf.execute("-control", "OI", "-sin", "1", "-tin", "2", binary=binary)
+    assert nb_runs() == 2
+
+def test_exclude_perturbations_cache(cf):
+    excfile = cf.make_exclude_perturbations(["a", "b+"])
+    assert cf.make_exclude_perturbations(["b+", "a"]) == excfile
+    os.unlink(excfile)
+    excfile = cf.make_exclude_perturbations(["a", "b+"])
+    assert os.path.exists(excfile)
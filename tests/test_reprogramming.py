@@ -0,0 +1,99 @@
+import collections
+import os
+import threading
+
+import pytest
+
+from colomoto.minibn import BooleanNetwork
+from colomoto.types import Hypercube, HypercubeCollection
+
+import cabean
+from cabean import synthetic
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture
+def cb(monkeypatch):
+    monkeypatch.setattr(cabean.iface, "cabean_binary",
+                        synthetic.standin_command())
+    monkeypatch.setenv("PYTHONPATH", REPO)
+    monkeypatch.setenv("CABEAN_SYNTHETIC", "attractors=3,controls=2")
+    return cabean.load(BooleanNetwork({"a": "b", "b": "a", "c": "!c"}))
+
+def test_trivial_pair(standin, monkeypatch):
+    s = standin(sizes="attractors=3,controls=2")
+    monkeypatch.setattr(cabean.iface, "cabean_binary", s.command)
+    cb = cabean.load(BooleanNetwork({"a": "b", "b": "a", "c": "!c"}))
+    # only attractor 0 has c=0
+    assert cabean.matching_attractors(cb.attractors, {"c": 0}) == [0]
+    nb_runs = len(s.runs())
+    rs = cabean.OneStep_Instantaneous(cb).attractor_to_attractor(
+            {"c": 0}, {"c": 0})
+    assert len(s.runs()) == nb_runs
+    assert list(map(repr, rs)) == [repr((cabean.FromSteadyState("a0",
+                cabean.InstantaneousPerturbation({})), {"result": "a0"}))]
+
+def test_control_pairs(cb):
+    cb.attractors = {
+        0: Hypercube(a=0, b=0, c=0),
+        1: Hypercube(a=1, b=0, c=0),
+        2: Hypercube(a=1, b=1, c=1),
+    }
+    ids = [0, 1, 2]
+    assert cb.trivial_pairs(ids, ids) == [(0, 0), (1, 1), (2, 2)]
+    assert cb.control_pairs(ids, ids) == \
+            [(0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1)]
+    assert cb.control_pairs(ids, ids, ordered=True) == \
+            [(0, 2), (2, 0), (1, 2), (2, 1), (0, 1), (1, 0)]
+
+def test_fixed_values():
+    assert cabean.fixed_values(Hypercube(a=1, b="*", c=0)) == {"a": 1, "c": 0}
+    hc = HypercubeCollection([Hypercube(a=1, b=0, c="*"),
+                              Hypercube(a=1, b=1, c=0)])
+    assert cabean.fixed_values(hc) == {"a": 1}
+
+def test_multimethod(cb):
+    rs = cabean.MultiMethod(cb).attractor_to_attractor({}, {},
+            ["OI", "OI", "ASP"], maxpert=2)
+    assert list(rs) == ["OI", "ASP"]
+    for m, cls in [("OI", cabean.OneStep_Instantaneous),
+                   ("ASP", cabean.AttractorSequential_Permanent)]:
+        kwargs = {"maxpert": 2} if m == "ASP" else {}
+        expected = cls(cb).attractor_to_attractor({}, {}, **kwargs)
+        assert list(map(repr, rs[m])) == list(map(repr, expected))
+
+def test_shared_instance(standin, monkeypatch):
+    s = standin(sizes="attractors=3,controls=2", delay=0.5)
+    monkeypatch.setattr(cabean.iface, "cabean_binary", s.command)
+    cb = cabean.load(BooleanNetwork({"a": "b", "b": "a", "c": "!c"}))
+    progs = [cabean.OneStep_Instantaneous(cb),
+             cabean.AttractorSequential_Temporary(cb)]
+    n = 4
+    barrier = threading.Barrier(n*len(progs))
+    results = [[None]*n for _ in progs]
+    def run(i, j):
+        barrier.wait()
+        results[i][j] = progs[i].attractor_to_attractor({}, {})
+    threads = [threading.Thread(target=run, args=(i, j))
+                for i in range(len(progs)) for j in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # 3 trivial pairs, 6 controlled pairs with 2 control sets per step
+    for rs, nb_strategies in zip(results, [3 + 6*2, 3 + 6*2**2]):
+        assert all(list(map(repr, r)) == list(map(repr, rs[0])) for r in rs)
+        assert len(list(rs[0])) == nb_strategies
+    queries = collections.Counter([r for r in s.runs() if "-control" in r])
+    assert len(queries) == 6*len(progs)
+    assert set(queries.values()) == {1}
+
+def test_multimethod_failure(standin, monkeypatch):
+    s = standin(sizes="attractors=6,controls=2", delay=0.2, fail="-control")
+    monkeypatch.setattr(cabean.iface, "cabean_binary", s.command)
+    cb = cabean.load(BooleanNetwork({"a": "b", "b": "a", "c": "!c", "d": "d"}))
+    with pytest.raises(cabean.iface.CabeanProcessError):
+        cabean.MultiMethod(cb).attractor_to_attractor({}, {}, ["OI", "OT"],
+                max_workers=2)
+    # pending executions are cancelled after the first failure
+    assert len([r for r in s.runs() if "-control" in r]) <= 2*2
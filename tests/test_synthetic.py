@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+import pytest
+
+from cabean import synthetic
+from cabean.iface import CabeanResult
+
+NODES = ["a", "b", "c", "d"]
+
+def parse(**kwargs):
+    output = synthetic.generate_output(NODES, **kwargs)
+    return CabeanResult(SimpleNamespace(ordered_nodes=NODES), output)
+
+def test_attractors():
+    result = parse(nb_attractors=5, attractor_size=3)
+    assert len(result.attractors) == 5
+    assert all(len(a) == 3 for a in result.attractors.values())
+
+@pytest.mark.parametrize("method", ["OI", "OT", "OP"])
+def test_onestep(method):
+    result = parse(nb_attractors=4, control=method, nb_controls=3)
+    assert len(result.attractors) == 4
+    controls = getattr(result, "parse_{}".format(method))()
+    assert len(controls) == 4*3
+    assert all(len(c) == 3 for c in controls.values())
+
+@pytest.mark.parametrize("method", ["ASI", "AST", "ASP"])
+def test_attractor_sequential(method):
+    result = parse(nb_attractors=4, control=method, pairs=[(0, 1), (2, 3)],
+                    nb_controls=2, nb_steps=3)
+    assert len(result.attractors) == 4
+    controls = getattr(result, "parse_{}".format(method))()
+    assert sorted(controls) == [(0, 1), (2, 3)]
+    for paths in controls.values():
+        assert len(paths) == 2**3
+        assert all(len(path) == 3 for path in paths)
+
+def test_attractor_sequential_too_many_steps():
+    with pytest.raises(ValueError):
+        parse(nb_attractors=3, control="ASI", nb_steps=3)
+
+def test_sequential():
+    result = parse(control="GSI", nb_controls=2, nb_steps=3)
+    controls = result.parse_GSI()
+    assert len(controls) == 3
+    assert all(len(step) == 2 for step in controls)